@@ -1,18 +1,28 @@
 import streamlit as st
 from google.cloud import bigquery
+from google.cloud import bigquery_storage
 import os
+import hashlib
 import pandas as pd
-from datetime import datetime, date
+import numpy as np
+from datetime import datetime, time, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly_resampler import FigureResampler
+from plotly_resampler.aggregation import LTTB
 from google.oauth2 import service_account
 
 
 
-credentials = service_account.Credentials.from_service_account_info(
-    st.secrets["gcp_service_account"]
-)
-client = bigquery.Client(credentials=credentials, project=credentials.project_id)
+@st.cache_resource
+def get_clients():
+    """Create the BigQuery clients once and share them across sessions"""
+    credentials = service_account.Credentials.from_service_account_info(
+        st.secrets["gcp_service_account"]
+    )
+    client = bigquery.Client(credentials=credentials, project=credentials.project_id)
+    bqstorage_client = bigquery_storage.BigQueryReadClient(credentials=credentials)
+    return client, bqstorage_client
 
 st.set_page_config(page_title="Space Report", layout="wide")
 
@@ -94,42 +104,136 @@ st.markdown("""
 # -------------------------------
 # Database Functions
 # -------------------------------
-@st.cache_data(ttl=300)
-def get_space_data():
-    """Fetch all space report data from BigQuery"""
-    query = """
-    SELECT * 
-    FROM `spacereport-477420.SpaceReportDB.Database` 
+NUMERIC_DTYPES = {
+    'TotalSizeGB': 'float32',
+    'UsedSpaceGB': 'float32',
+    'FreeSpaceGB': 'float32',
+    'FreeSpacePercent': 'float32'
+}
+
+TREND_MAX_POINTS = 800
+
+# Free space % thresholds: < 5 emergency, < 10 critical, < 20 warning
+STATUS_THRESHOLDS = np.array([5, 10, 20])
+STATUS_CLASSES = np.array(['status-emergency', 'status-critical', 'status-warning', 'status-healthy'])
+STATUS_TEXTS = np.array(['Emergency', 'Critical', 'Warning', 'Healthy'])
+STATUS_COLORS = np.array(['#ff6b6b', '#ff8787', '#ffd43b', '#51cf66'])
+
+TABLE_ID = "spacereport-477420.SpaceReportDB.Database"
+
+REPORT_FILTER = """
+    WHERE Date >= @start_time AND Date < @end_time
+      AND (ARRAY_LENGTH(@drives) = 0 OR Drive IN UNNEST(@drives))
+"""
+
+FILTERED_QUERY = """
+    SELECT Date, Drive, TotalSizeGB, UsedSpaceGB, FreeSpaceGB, FreeSpacePercent
+    FROM `{table_id}`
+    {report_filter}
     ORDER BY Date DESC
     LIMIT 1000
-    """
-    df = client.query(query).to_dataframe()
+"""
+
+LATEST_QUERY = """
+    SELECT latest.*
+    FROM (
+        SELECT ARRAY_AGG(
+            STRUCT(Date, Drive, TotalSizeGB, UsedSpaceGB, FreeSpaceGB, FreeSpacePercent)
+            ORDER BY Date DESC LIMIT 1
+        )[OFFSET(0)] AS latest
+        FROM `{table_id}`
+        {report_filter}
+        GROUP BY Drive
+    )
+    ORDER BY latest.Drive
+"""
+
+def load_dataframe(job):
+    """Wait for a query job and download the result through the BigQuery Storage API"""
+    _, bqstorage_client = get_clients()
+    df = job.to_dataframe(
+        bqstorage_client=bqstorage_client,
+        create_bqstorage_client=False,
+        dtypes=NUMERIC_DTYPES
+    )
     
     # Ensure Date column is datetime
     if 'Date' in df.columns:
         df['Date'] = pd.to_datetime(df['Date'])
+        df['DateStr'] = df['Date'].dt.strftime('%Y-%m-%d %H:%M')
+    
+    if 'Drive' in df.columns:
+        df['Drive'] = df['Drive'].astype('category')
     
     return df
 
-def get_date_range(df):
-    """Get min and max dates from the data"""
-    if df.empty:
-        return date.today(), date.today()
-    return df['Date'].min().date(), df['Date'].max().date()
+@st.cache_data(ttl=3600)
+def get_date_type(table_id):
+    """Look up the BigQuery type of the Date column"""
+    client, _ = get_clients()
+    date_field = next(field for field in client.get_table(table_id).schema if field.name == 'Date')
+    if date_field.field_type not in ('DATE', 'DATETIME', 'TIMESTAMP'):
+        raise ValueError(f"Unsupported Date column type {date_field.field_type} in {table_id}")
+    return date_field.field_type
 
-def get_latest_stats(df, selected_drives=None):
-    """Calculate latest statistics for selected drives"""
-    if df.empty:
-        return None
-    
-    if selected_drives:
-        df = df[df['Drive'].isin(selected_drives)]
-    
-    if df.empty:
+def get_filter_config(date_type, start_date, end_date, drives):
+    """Build the query parameters for the date range and drive filters"""
+    # Half-open range on the raw Date column avoids a per-row DATE() cast.
+    # The bounds are bound with the column's own type since BigQuery does not
+    # coerce DATETIME parameters to TIMESTAMP (naive TIMESTAMP bounds are UTC,
+    # matching DATE(Date)).
+    end_date = end_date + timedelta(days=1)
+    if date_type == 'DATE':
+        start_time, end_time = start_date, end_date
+    else:
+        start_time = datetime.combine(start_date, time.min)
+        end_time = datetime.combine(end_date, time.min)
+    return bigquery.QueryJobConfig(query_parameters=[
+        bigquery.ScalarQueryParameter("start_time", date_type, start_time),
+        bigquery.ScalarQueryParameter("end_time", date_type, end_time),
+        bigquery.ArrayQueryParameter("drives", "STRING", list(drives))
+    ])
+
+@st.cache_data(ttl=300)
+def get_filter_metadata(table_id):
+    """Fetch the date bounds and drive list used to populate the filters"""
+    query = f"""
+    SELECT DATE(MIN(Date)) AS min_date, DATE(MAX(Date)) AS max_date,
+           ARRAY_AGG(DISTINCT Drive ORDER BY Drive) AS drives
+    FROM `{table_id}`
+    """
+    client, _ = get_clients()
+    return client.query(query).to_dataframe().iloc[0]
+
+@st.cache_data(ttl=300)
+def get_report_data(table_id, start_date, end_date, drives):
+    """Fetch the filtered rows and the latest row per drive for the selected filters"""
+    client, _ = get_clients()
+    job_config = get_filter_config(get_date_type(table_id), start_date, end_date, drives)
+    
+    # client.query returns as soon as the job is submitted, so both jobs run concurrently
+    filtered_job = client.query(
+        FILTERED_QUERY.format(table_id=table_id, report_filter=REPORT_FILTER), job_config=job_config
+    )
+    latest_job = client.query(
+        LATEST_QUERY.format(table_id=table_id, report_filter=REPORT_FILTER), job_config=job_config
+    )
+    
+    return load_dataframe(filtered_job), load_dataframe(latest_job)
+
+def get_filtered_data(table_id, start_date, end_date, drives):
+    """Space report rows for the selected date range and drives"""
+    return get_report_data(table_id, start_date, end_date, drives)[0]
+
+def get_latest_per_drive(table_id, start_date, end_date, drives):
+    """Most recent row of each drive for the selected filters"""
+    return get_report_data(table_id, start_date, end_date, drives)[1]
+
+def get_latest_stats(latest):
+    """Calculate latest statistics from the most recent row of each drive"""
+    if latest.empty:
         return None
     
-    latest = df.sort_values('Date', ascending=False).groupby('Drive').first().reset_index()
-    
     total_size = latest['TotalSizeGB'].sum()
     total_used = latest['UsedSpaceGB'].sum()
     total_free = latest['FreeSpaceGB'].sum()
@@ -145,52 +249,214 @@ def get_latest_stats(df, selected_drives=None):
         'latest_data': latest
     }
 
-def get_status_class(free_percent):
-    """Return status class based on free space percentage"""
-    if free_percent < 5:
-        return 'status-emergency'
-    elif free_percent < 10:
-        return 'status-critical'
-    elif free_percent < 20:
-        return 'status-warning'
-    else:
-        return 'status-healthy'
-
-def get_status_text(free_percent):
-    """Return status text based on free space percentage"""
-    if free_percent < 5:
-        return 'Emergency'
-    elif free_percent < 10:
-        return 'Critical'
-    elif free_percent < 20:
-        return 'Warning'
-    else:
-        return 'Healthy'
-
-def get_border_color(free_percent):
-    """Return border color based on free space percentage"""
-    if free_percent < 5:
-        return '#ff6b6b'
-    elif free_percent < 10:
-        return '#ff8787'
-    elif free_percent < 20:
-        return '#ffd43b'
-    else:
-        return '#51cf66'
+def get_growth_data(df):
+    """Calculate space growth for every drive with at least two readings"""
+    g = df.sort_values('Date').groupby('Drive', observed=True, sort=False)
+    growth_df = pd.DataFrame({
+        'Initial': g['UsedSpaceGB'].first(),
+        'Current': g['UsedSpaceGB'].last(),
+        'first_date': g['Date'].first(),
+        'last_date': g['Date'].last(),
+        'readings': g['Date'].count()
+    })
+    growth_df = growth_df[growth_df['readings'] >= 2].copy()
+    
+    growth_df['Growth'] = growth_df['Current'] - growth_df['Initial']
+    days = (growth_df['last_date'] - growth_df['first_date']).dt.days
+    growth_df['Avg Daily Growth'] = np.where(days > 0, growth_df['Growth'] / days.where(days > 0), 0)
+    
+    growth_df = growth_df.reset_index().sort_values('Drive')
+    return growth_df[['Drive', 'Initial', 'Current', 'Growth', 'Avg Daily Growth']]
+
+@st.cache_data(ttl=300)
+def compute_stats(latest):
+    """Latest statistics, cached on the content of the loaded latest rows"""
+    return get_latest_stats(latest)
+
+@st.cache_data(ttl=300)
+def compute_growth(df):
+    """Per-drive growth, cached on the content of the loaded rows"""
+    return get_growth_data(df)
+
+@st.cache_data(ttl=300)
+def compute_display_data(df):
+    """Data Table rows newest first with a search column, cached on the content of the loaded rows"""
+    df = df.sort_values('Date', ascending=False)
+    display_df = df[['DateStr', 'Drive', *NUMERIC_DTYPES]].rename(columns={'DateStr': 'Date'})
+    
+    # Stringify every column once per load so a search keystroke only scans one string column.
+    # Numbers use the same %.2f format as the column_config, so search matches what is shown.
+    display_df['SearchText'] = display_df['Date'].str.cat(
+        [display_df['Drive'].astype(str)] + [display_df[col].map('{:.2f}'.format) for col in NUMERIC_DTYPES],
+        sep='\n'
+    ).str.lower()
+    
+    return display_df
+
+DRIVE_CARD_TEMPLATE = """
+<div style="background: #1e293b; border-radius: 10px; padding: 1.5rem; margin-bottom: 1rem; border-left: 4px solid {border_color};">
+    <div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap;">
+        <div>
+            <h3 style="color: white; margin: 0;"><i class="bi bi-hdd"></i> Drive {Drive}</h3>
+            <p style="color: #94a3b8; margin: 0.5rem 0 0 0;">Total: {TotalSizeGB:.2f} GB</p>
+        </div>
+        <div style="text-align: right;">
+            <span class="status-dot {status_class}"></span>
+            <span style="color: white; font-weight: 600;">{status_text}</span>
+        </div>
+    </div>
+    <div style="margin-top: 1rem;">
+        <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem;">
+            <span style="color: #94a3b8;">Used: {UsedSpaceGB:.2f} GB ({used_percent:.1f}%)</span>
+            <span style="color: #94a3b8;">Free: {FreeSpaceGB:.2f} GB ({FreeSpacePercent:.1f}%)</span>
+        </div>
+        <div class="progress-bar">
+            <div class="progress-fill" style="width: {used_percent}%;"></div>
+        </div>
+    </div>
+</div>
+"""
+
+def get_status(free_percent):
+    """Return status classes, texts and border colors for free space percentages"""
+    idx = np.searchsorted(STATUS_THRESHOLDS, np.asarray(free_percent), side='right')
+    return STATUS_CLASSES[idx], STATUS_TEXTS[idx], STATUS_COLORS[idx]
+
+def get_frame_hash(df):
+    """Order-sensitive content hash of a frame, used to key cached figures"""
+    return hashlib.sha1(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()).hexdigest()
+
+def get_cached_figure(name, signature, build):
+    """Reuse a figure from session state while its inputs are unchanged"""
+    cached = st.session_state.get(name)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    fig = build()
+    st.session_state[name] = (signature, fig)
+    return fig
+
+def build_trend_figure(df):
+    """Build the used space trend chart"""
+    # Downsampling is static: st.plotly_chart has no Dash callback, so zooming
+    # in does not bring back the full-resolution points
+    fig_trend = FigureResampler(
+        go.Figure(),
+        default_n_shown_samples=TREND_MAX_POINTS,
+        default_downsampler=LTTB(),
+        show_mean_aggregation_size=False,
+        resampled_trace_prefix_suffix=('', '')
+    )
+
+    for drive, drive_data in df.sort_values('Date').groupby('Drive', observed=True):
+        fig_trend.add_trace(go.Scattergl(
+            mode='lines+markers',
+            name=f'{drive} Used Space',
+            hovertemplate='<b>%{fullData.name}</b><br>Date: %{x}<br>Used: %{y:.2f} GB<extra></extra>'
+        ), hf_x=drive_data['Date'], hf_y=drive_data['UsedSpaceGB'])
+
+    fig_trend.update_layout(
+        template="plotly_dark",
+        xaxis_title="Date",
+        yaxis_title="Used Space (GB)",
+        hovermode='x unified',
+        height=400
+    )
+    return fig_trend
+
+def build_free_figure(df):
+    """Build the free space percentage trend chart"""
+    # Downsampling is static: st.plotly_chart has no Dash callback, so zooming
+    # in does not bring back the full-resolution points
+    fig_free = FigureResampler(
+        go.Figure(),
+        default_n_shown_samples=TREND_MAX_POINTS,
+        default_downsampler=LTTB(),
+        show_mean_aggregation_size=False,
+        resampled_trace_prefix_suffix=('', '')
+    )
+
+    for drive, drive_data in df.sort_values('Date').groupby('Drive', observed=True):
+        fig_free.add_trace(go.Scattergl(
+            mode='lines+markers',
+            name=f'{drive} Free %',
+            hovertemplate='<b>%{fullData.name}</b><br>Date: %{x}<br>Free: %{y:.2f}%<extra></extra>'
+        ), hf_x=drive_data['Date'], hf_y=drive_data['FreeSpacePercent'])
+
+    fig_free.add_hline(y=10, line_dash="dash", line_color="red", 
+                      annotation_text="Critical Threshold (10%)")
+
+    fig_free.update_layout(
+        template="plotly_dark",
+        xaxis_title="Date",
+        yaxis_title="Free Space (%)",
+        hovermode='x unified',
+        height=400
+    )
+    return fig_free
+
+def build_status_figure(latest):
+    """Build the stacked used/free bar chart of the current drive status"""
+    fig_bar = go.Figure()
+
+    fig_bar.add_trace(go.Bar(
+        name='Used Space',
+        x=latest['Drive'],
+        y=latest['UsedSpaceGB'],
+        marker_color='#3b82f6',
+        texttemplate='%{y:.2f}',
+        textposition='inside'
+    ))
+
+    fig_bar.add_trace(go.Bar(
+        name='Free Space',
+        x=latest['Drive'],
+        y=latest['FreeSpaceGB'],
+        marker_color='#10b981',
+        texttemplate='%{y:.2f}',
+        textposition='inside'
+    ))
+
+    fig_bar.update_layout(
+        barmode='stack',
+        template="plotly_dark",
+        xaxis_title="Drive",
+        yaxis_title="Space (GB)",
+        height=400
+    )
+    return fig_bar
+
+def build_growth_figure(df):
+    """Build the space growth bar chart"""
+    fig_growth = go.Figure()
+    fig_growth.add_trace(go.Bar(
+        x=df['Drive'],
+        y=df['Growth'],
+        marker_color=['#ff6b6b' if x > 0 else '#51cf66' for x in df['Growth']],
+        texttemplate='%{y:.2f}',
+        textposition='outside',
+        name='Growth (GB)'
+    ))
+
+    fig_growth.update_layout(
+        template="plotly_dark",
+        xaxis_title="Drive",
+        yaxis_title="Growth (GB)",
+        height=400
+    )
+    return fig_growth
 
 def main():
 
     
-    with st.spinner("Loading space report data..."):
-        df = get_space_data()
+    metadata = get_filter_metadata(TABLE_ID)
     
-    if df.empty:
+    if pd.isna(metadata['min_date']):
         st.warning("⚠️ No space report data available.")
         return
     
-    min_date, max_date = get_date_range(df)
+    min_date, max_date = metadata['min_date'], metadata['max_date']
     
-    all_drives = sorted(df['Drive'].unique().tolist())
+    all_drives = list(metadata['drives'])
     
     st.markdown('<div class="section-header"><i class="bi bi-sliders"></i><h3>Filters</h3></div>', unsafe_allow_html=True)
     
@@ -208,16 +474,16 @@ def main():
         st.markdown('<i class="bi bi-hdd"></i> **Select Drives**', unsafe_allow_html=True)
         selected_drives = st.multiselect("Drives", all_drives, default=all_drives, label_visibility="collapsed")
 
-    filtered_df = df[(df['Date'].dt.date >= start_date) & (df['Date'].dt.date <= end_date)]
-
-    if selected_drives:
-        filtered_df = filtered_df[filtered_df['Drive'].isin(selected_drives)]
+    drives = tuple(selected_drives)
+    
+    with st.spinner("Loading space report data..."):
+        filtered_df = get_filtered_data(TABLE_ID, start_date, end_date, drives)
     
     if filtered_df.empty:
         st.warning("⚠️ No data available for selected filters.")
         return
     
-    stats = get_latest_stats(filtered_df, selected_drives)
+    stats = compute_stats(get_latest_per_drive(TABLE_ID, start_date, end_date, drives))
     
     if stats is None:
         st.error("Unable to calculate statistics.")
@@ -284,190 +550,78 @@ def main():
     with tab1:
         st.markdown('<div class="section-header"><i class="bi bi-graph-up-arrow"></i><h3>Space Usage Trends</h3></div>', unsafe_allow_html=True)
         
-        fig_trend = go.Figure()
+        filtered_hash = get_frame_hash(filtered_df)
         
-        for drive in filtered_df['Drive'].unique():
-            drive_data = filtered_df[filtered_df['Drive'] == drive].sort_values('Date')
-            fig_trend.add_trace(go.Scatter(
-                x=drive_data['Date'],
-                y=drive_data['UsedSpaceGB'],
-                mode='lines+markers',
-                name=f'{drive} Used Space',
-                hovertemplate='<b>%{fullData.name}</b><br>Date: %{x}<br>Used: %{y:.2f} GB<extra></extra>'
-            ))
+        fig_trend = get_cached_figure(f'{TABLE_ID}.fig_trend', filtered_hash, lambda: build_trend_figure(filtered_df))
         
-        fig_trend.update_layout(
-            template="plotly_dark",
-            xaxis_title="Date",
-            yaxis_title="Used Space (GB)",
-            hovermode='x unified',
-            height=400
-        )
-        
-        st.plotly_chart(fig_trend, use_container_width=True)
+        st.plotly_chart(fig_trend, use_container_width=True, key='trend')
         
         st.markdown('<div class="section-header"><i class="bi bi-activity"></i><h3>Free Space Percentage Trend</h3></div>', unsafe_allow_html=True)
         
-        fig_free = go.Figure()
-        
-        for drive in filtered_df['Drive'].unique():
-            drive_data = filtered_df[filtered_df['Drive'] == drive].sort_values('Date')
-            fig_free.add_trace(go.Scatter(
-                x=drive_data['Date'],
-                y=drive_data['FreeSpacePercent'],
-                mode='lines+markers',
-                name=f'{drive} Free %',
-                hovertemplate='<b>%{fullData.name}</b><br>Date: %{x}<br>Free: %{y:.2f}%<extra></extra>'
-            ))
-        
-        fig_free.add_hline(y=10, line_dash="dash", line_color="red", 
-                          annotation_text="Critical Threshold (10%)")
-        
-        fig_free.update_layout(
-            template="plotly_dark",
-            xaxis_title="Date",
-            yaxis_title="Free Space (%)",
-            hovermode='x unified',
-            height=400
-        )
+        fig_free = get_cached_figure(f'{TABLE_ID}.fig_free', filtered_hash, lambda: build_free_figure(filtered_df))
         
-        st.plotly_chart(fig_free, use_container_width=True)
+        st.plotly_chart(fig_free, use_container_width=True, key='free')
     
     with tab2:
         st.markdown('<div class="section-header"><i class="bi bi-hdd"></i><h3>Current Drive Status</h3></div>', unsafe_allow_html=True)
         
         latest_status = stats['latest_data']
         
-        fig_bar = go.Figure()
+        fig_bar = get_cached_figure(f'{TABLE_ID}.fig_bar', get_frame_hash(latest_status), lambda: build_status_figure(latest_status))
         
-        fig_bar.add_trace(go.Bar(
-            name='Used Space',
-            x=latest_status['Drive'],
-            y=latest_status['UsedSpaceGB'],
-            marker_color='#3b82f6',
-            text=latest_status['UsedSpaceGB'].round(2),
-            textposition='inside'
-        ))
+        st.plotly_chart(fig_bar, use_container_width=True, key='status')
         
-        fig_bar.add_trace(go.Bar(
-            name='Free Space',
-            x=latest_status['Drive'],
-            y=latest_status['FreeSpaceGB'],
-            marker_color='#10b981',
-            text=latest_status['FreeSpaceGB'].round(2),
-            textposition='inside'
-        ))
-        
-        fig_bar.update_layout(
-            barmode='stack',
-            template="plotly_dark",
-            xaxis_title="Drive",
-            yaxis_title="Space (GB)",
-            height=400
-        )
+        st.markdown('<div class="section-header"><i class="bi bi-list-check"></i><h4>Drive Details</h4></div>', unsafe_allow_html=True)
         
-        st.plotly_chart(fig_bar, use_container_width=True)
+        status_classes, status_texts, border_colors = get_status(latest_status['FreeSpacePercent'])
         
-        st.markdown('<div class="section-header"><i class="bi bi-list-check"></i><h4>Drive Details</h4></div>', unsafe_allow_html=True)
+        cards = latest_status.assign(
+            status_class=status_classes,
+            status_text=status_texts,
+            border_color=border_colors,
+            used_percent=100 - latest_status['FreeSpacePercent']
+        )
         
-        for _, row in latest_status.iterrows():
-            status_class = get_status_class(row['FreeSpacePercent'])
-            status_text = get_status_text(row['FreeSpacePercent'])
-            used_percent = 100 - row['FreeSpacePercent']
-            border_color = get_border_color(row['FreeSpacePercent'])
-            
-            st.markdown(f"""
-            <div style="background: #1e293b; border-radius: 10px; padding: 1.5rem; margin-bottom: 1rem; border-left: 4px solid {border_color};">
-                <div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap;">
-                    <div>
-                        <h3 style="color: white; margin: 0;"><i class="bi bi-hdd"></i> Drive {row['Drive']}</h3>
-                        <p style="color: #94a3b8; margin: 0.5rem 0 0 0;">Total: {row['TotalSizeGB']:.2f} GB</p>
-                    </div>
-                    <div style="text-align: right;">
-                        <span class="status-dot {status_class}"></span>
-                        <span style="color: white; font-weight: 600;">{status_text}</span>
-                    </div>
-                </div>
-                <div style="margin-top: 1rem;">
-                    <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem;">
-                        <span style="color: #94a3b8;">Used: {row['UsedSpaceGB']:.2f} GB ({used_percent:.1f}%)</span>
-                        <span style="color: #94a3b8;">Free: {row['FreeSpaceGB']:.2f} GB ({row['FreeSpacePercent']:.1f}%)</span>
-                    </div>
-                    <div class="progress-bar">
-                        <div class="progress-fill" style="width: {used_percent}%;"></div>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(
+            "".join(DRIVE_CARD_TEMPLATE.format(**card) for card in cards.to_dict('records')),
+            unsafe_allow_html=True
+        )
     
     with tab3:
 
         st.markdown('<div class="section-header"><i class="bi bi-graph-up"></i><h3>Space Growth Analysis</h3></div>', unsafe_allow_html=True)
         
-        growth_data = []
-        for drive in selected_drives:
-            drive_df = filtered_df[filtered_df['Drive'] == drive].sort_values('Date')
-            if len(drive_df) >= 2:
-                first_used = drive_df.iloc[0]['UsedSpaceGB']
-                last_used = drive_df.iloc[-1]['UsedSpaceGB']
-                growth = last_used - first_used
-                days = (drive_df.iloc[-1]['Date'] - drive_df.iloc[0]['Date']).days
-                avg_daily_growth = growth / days if days > 0 else 0
-                
-                growth_data.append({
-                    'Drive': drive,
-                    'Initial': first_used,
-                    'Current': last_used,
-                    'Growth': growth,
-                    'Avg Daily Growth': avg_daily_growth
-                })
+        growth_df = compute_growth(filtered_df)
         
-        if growth_data:
-            growth_df = pd.DataFrame(growth_data)
-            
-            fig_growth = go.Figure()
-            fig_growth.add_trace(go.Bar(
-                x=growth_df['Drive'],
-                y=growth_df['Growth'],
-                marker_color=['#ff6b6b' if x > 0 else '#51cf66' for x in growth_df['Growth']],
-                text=growth_df['Growth'].round(2),
-                textposition='outside',
-                name='Growth (GB)'
-            ))
+        if not growth_df.empty:
+            fig_growth = get_cached_figure(f'{TABLE_ID}.fig_growth', get_frame_hash(growth_df), lambda: build_growth_figure(growth_df))
             
-            fig_growth.update_layout(
-                template="plotly_dark",
-                xaxis_title="Drive",
-                yaxis_title="Growth (GB)",
-                height=400
-            )
-            
-            st.plotly_chart(fig_growth, use_container_width=True)
+            st.plotly_chart(fig_growth, use_container_width=True, key='growth')
     
     with tab4:
         st.markdown('<div class="section-header"><i class="bi bi-table"></i><h3>All Space Report Data</h3></div>', unsafe_allow_html=True)
         
-        st.markdown('<i class="bi bi-search"></i> **Search Data**', unsafe_allow_html=True)
-        search_query = st.text_input("Search", placeholder="Type to search...", label_visibility="collapsed")
-        
-        display_df = filtered_df.copy()
-        
-        if search_query:
-            mask = display_df.apply(lambda row: row.astype(str).str.contains(search_query, case=False, na=False).any(), axis=1)
-            display_df = display_df[mask]
-        
-        display_df = display_df.sort_values('Date', ascending=False)
-        display_df['Date'] = display_df['Date'].dt.strftime('%Y-%m-%d %H:%M')
-        display_df['UsedSpaceGB'] = display_df['UsedSpaceGB'].round(2)
-        display_df['FreeSpaceGB'] = display_df['FreeSpaceGB'].round(2)
-        display_df['TotalSizeGB'] = display_df['TotalSizeGB'].round(2)
-        display_df['FreeSpacePercent'] = display_df['FreeSpacePercent'].round(2)
-        
-        st.dataframe(
-            display_df[['Date', 'Drive', 'TotalSizeGB', 'UsedSpaceGB', 'FreeSpaceGB', 'FreeSpacePercent']],
-            use_container_width=True,
-            hide_index=True
-        )
+        # The table is only built and sent to the browser once the user asks for it
+        if st.checkbox("Show data", key="show_data"):
+            st.markdown('<i class="bi bi-search"></i> **Search Data**', unsafe_allow_html=True)
+            search_query = st.text_input("Search", placeholder="Type to search...", label_visibility="collapsed")
+            
+            display_df = compute_display_data(filtered_df)
+            
+            if search_query:
+                display_df = display_df[display_df['SearchText'].str.contains(search_query.lower(), regex=False)]
+            
+            st.dataframe(
+                display_df[['Date', 'Drive', 'TotalSizeGB', 'UsedSpaceGB', 'FreeSpaceGB', 'FreeSpacePercent']],
+                column_config={
+                    'TotalSizeGB': st.column_config.NumberColumn(format='%.2f'),
+                    'UsedSpaceGB': st.column_config.NumberColumn(format='%.2f'),
+                    'FreeSpaceGB': st.column_config.NumberColumn(format='%.2f'),
+                    'FreeSpacePercent': st.column_config.NumberColumn(format='%.2f %%')
+                },
+                use_container_width=True,
+                hide_index=True
+            )
         
         st.markdown("""
         <div style="margin-top: 1rem; padding: 1rem; background: #1e293b; border-radius: 10px;">